@@ -0,0 +1,107 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from scipy.spatial import Delaunay, QhullError
+
+from Kruskal_algorithm_for_random_nodes import kruskal_mst
+from Prim_algorithm_for_random_nodes import prim_mst
+
+# Öklid MST'si her zaman Delaunay üçgenlemesinin bir alt grafıdır.
+# Bu yüzden tam graf (O(n²)) yerine yalnızca Delaunay kenarları aday olarak alınır (O(n)).
+def _delaunay_edges(coords):
+    dim = coords.shape[1]
+    tri = Delaunay(coords)
+
+    # Her simpleksin tüm köşe çiftleri bir aday kenardır
+    simplices = tri.simplices
+    pairs = [simplices[:, [a, b]] for a in range(dim + 1) for b in range(a + 1, dim + 1)]
+    edges = np.sort(np.concatenate(pairs), axis=1)
+
+    # Qhull'un üçgenlemeye katmadığı (çakışık) noktaları en yakın köşeye bağla
+    if len(tri.coplanar):
+        extra = np.sort(tri.coplanar[:, [0, 2]], axis=1)
+        edges = np.concatenate([edges, extra])
+    return np.unique(edges, axis=0)
+
+# Noktalar daha düşük boyutlu bir alt uzayda ise (ör. hepsi aynı doğru üzerinde)
+# Delaunay tanımsızdır; noktalar o alt uzaya izdüşürülür, mesafeler korunur.
+def _candidate_edges(coords):
+    n, dim = coords.shape
+    centered = coords - coords.mean(axis=0)
+    _, s, vt = np.linalg.svd(centered, full_matrices=False)
+    rank = int(np.sum(s > s[0] * 1e-12)) if s[0] > 0 else 0
+
+    if rank == 0:  # Tüm noktalar aynı: zincir yeterli
+        order = np.arange(n)
+        return np.stack([order[:-1], order[1:]], axis=1)
+    if n <= rank + 1:  # Çok az nokta: tam graf zaten küçük
+        i, j = np.triu_indices(n, 1)
+        return np.stack([i, j], axis=1)
+    if rank < dim:
+        coords = centered @ vt[:rank].T
+    if rank == 1:  # Tek boyutta MST sıralı komşuları birleştirir
+        order = np.argsort(coords[:, 0], kind='stable')
+        return np.stack([order[:-1], order[1:]], axis=1)
+
+    try:
+        return _delaunay_edges(coords)
+    except QhullError:
+        i, j = np.triu_indices(n, 1)
+        return np.stack([i, j], axis=1)
+
+# Koordinatlardan (n x 2 veya n x 3) tam Öklid MST'si
+def euclidean_mst(points, method='kruskal'):
+    coords = np.asarray(points, dtype=np.float64)
+    if coords.ndim != 2 or coords.shape[1] not in (2, 3):
+        raise ValueError("Noktalar (n, 2) veya (n, 3) boyutunda olmalıdır")
+    n = len(coords)
+    if n < 2:
+        return []
+
+    edges = _candidate_edges(coords)
+    lengths = np.linalg.norm(coords[edges[:, 0]] - coords[edges[:, 1]], axis=1)
+
+    # Seyrek aday kümesiyle mevcut Kruskal/Prim'in beklediği sözlük grafını kur
+    graph = {i: {} for i in range(n)}
+    for (u, v), weight in zip(edges.tolist(), lengths.tolist()):
+        graph[u][v] = weight
+        graph[v][u] = weight
+
+    if method == 'kruskal':
+        return list(kruskal_mst(graph))
+    if method == 'prim':
+        return prim_mst(graph, 0)
+    raise ValueError(f"Bilinmeyen yöntem: {method}")
+
+def visualize_mst(points, mst):
+    coords = np.asarray(points)
+    plt.figure(figsize=(10, 8))
+    for u, v, _ in mst:
+        plt.plot(coords[[u, v], 0], coords[[u, v], 1], color='green', linewidth=1)
+    plt.scatter(coords[:, 0], coords[:, 1], color='lightblue', edgecolors='black', s=30, zorder=2)
+
+    total = sum(weight for _, _, weight in mst)
+    plt.title(f"Öklid MST - {len(coords)} nokta\nToplam uzunluk: {total:.3f}", fontsize=14, pad=20)
+    plt.axis('equal')
+    plt.show()
+
+def main():
+    try:
+        num_points = int(input("Nokta sayısını girin (örneğin, 200): "))
+        if num_points <= 0:
+            print("Nokta sayısı pozitif olmalıdır!")
+            return
+    except ValueError:
+        print("Geçerli bir sayı girin!")
+        return
+
+    points = np.random.rand(num_points, 2)
+    mst = euclidean_mst(points, method='kruskal')
+
+    print(f"\nMST kenar sayısı: {len(mst)}")
+    print(f"Toplam uzunluk (Kruskal): {sum(w for _, _, w in mst):.6f}")
+    print(f"Toplam uzunluk (Prim):    {sum(w for _, _, w in euclidean_mst(points, method='prim')):.6f}")
+
+    visualize_mst(points, mst)
+
+if __name__ == "__main__":
+    main()
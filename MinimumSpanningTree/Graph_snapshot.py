@@ -0,0 +1,220 @@
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+from Kruskal_algorithm_for_random_nodes import create_random_graph, kruskal_mst
+
+SNAPSHOT_VERSION = 1
+MANIFEST = 'manifest.json'
+
+# Sözlük grafını ön işlenmiş dizilere çevir:
+# - komşuluk (CSR): indptr, indices, weights
+# - ağırlığa göre sıralı kenar listesi (Kruskal sırası)
+# - MST kenarları
+# - seçilen kaynaklar için en kısa yol ağaçları (mesafe + önceki düğüm)
+def build_artifacts(graph, sources=()):
+    nodes = list(graph.keys())
+    # Etiketler JSON manifestinde saklanır; tuple gibi türler liste olarak geri döner
+    for node in nodes:
+        if isinstance(node, bool) or not isinstance(node, (str, int)):
+            raise TypeError(f"Düğüm etiketleri str veya int olmalıdır: {node!r}")
+    node_index = {node: i for i, node in enumerate(nodes)}
+    n = len(nodes)
+
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    indices, weights = [], []
+    for i, u in enumerate(nodes):
+        for v, weight in graph[u].items():
+            indices.append(node_index[v])
+            weights.append(weight)
+        indptr[i + 1] = len(indices)
+    indices = np.array(indices, dtype=np.int64)
+    weights = np.array(weights, dtype=np.float64)
+
+    # Her yönsüz kenar bir kez, ağırlığa göre sıralı
+    src = np.repeat(np.arange(n), np.diff(indptr))
+    once = src < indices
+    edge_u, edge_v, edge_w = src[once], indices[once], weights[once]
+    order = np.argsort(edge_w, kind='stable')
+    edge_u, edge_v, edge_w = edge_u[order], edge_v[order], edge_w[order]
+
+    mst = list(kruskal_mst(graph))
+    mst_u = np.array([node_index[u] for u, _, _ in mst], dtype=np.int64)
+    mst_v = np.array([node_index[v] for _, v, _ in mst], dtype=np.int64)
+    mst_w = np.array([w for _, _, w in mst], dtype=np.float64)
+
+    source_ids = np.array([node_index[s] for s in sources], dtype=np.int64)
+    distances = np.full((len(source_ids), n), np.inf)
+    predecessors = np.full((len(source_ids), n), -1, dtype=np.int64)
+    if len(source_ids):
+        adjacency = csr_matrix((weights, indices, indptr), shape=(n, n))
+        distances[:], pred = dijkstra(adjacency, indices=source_ids, return_predecessors=True)
+        predecessors[:] = np.where(pred < 0, -1, pred)
+
+    arrays = {
+        'indptr': indptr, 'indices': indices, 'weights': weights,
+        'edge_u': edge_u, 'edge_v': edge_v, 'edge_w': edge_w,
+        'mst_u': mst_u, 'mst_v': mst_v, 'mst_w': mst_w,
+        'sources': source_ids, 'distances': distances, 'predecessors': predecessors,
+    }
+    return nodes, arrays
+
+def _sha256(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+# Anlık görüntüyü diske yaz: her dizi ayrı .npy dosyası + sürüm ve sağlama toplamlı manifest.
+# Önce geçici klasöre yazılır; eski görüntü '<path>.old' adına çekilir, yenisi yerine
+# taşınır, sonra eski silinir. Arada kesilirse load_snapshot '<path>.old'u okur.
+def save_snapshot(path, nodes, arrays):
+    path = os.path.abspath(path)
+    old = path + '.old'
+    tmp = tempfile.mkdtemp(prefix='.snapshot-', dir=os.path.dirname(path))
+    try:
+        manifest = {'version': SNAPSHOT_VERSION, 'nodes': nodes, 'arrays': {}}
+        for name, array in arrays.items():
+            file_name = f"{name}.npy"
+            file_path = os.path.join(tmp, file_name)
+            np.save(file_path, np.ascontiguousarray(array))
+            manifest['arrays'][name] = {
+                'file': file_name,
+                'dtype': str(array.dtype),
+                'shape': list(array.shape),
+                'sha256': _sha256(file_path),
+            }
+        with open(os.path.join(tmp, MANIFEST), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        # mkdtemp 0700 oluşturur; izinler normal mkdir/open'ın umask ile vereceği değere çekilir
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp, 0o777 & ~umask)
+        for file_name in os.listdir(tmp):
+            os.chmod(os.path.join(tmp, file_name), 0o666 & ~umask)
+
+        if os.path.lexists(path):
+            _remove(old)
+            os.replace(path, old)
+        os.replace(tmp, path)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    _remove(old)
+
+def _remove(path):
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    elif os.path.lexists(path):
+        os.remove(path)
+
+def _read_manifest(path):
+    if not os.path.exists(os.path.join(path, MANIFEST)) and os.path.exists(os.path.join(path + '.old', MANIFEST)):
+        path = path + '.old'  # Değiştirme sırasında yarıda kalmış kayıt
+    with open(os.path.join(path, MANIFEST), encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('version') != SNAPSHOT_VERSION:
+        raise ValueError(f"Desteklenmeyen anlık görüntü sürümü: {manifest.get('version')}")
+    return path, manifest
+
+# Tüm dizi dosyalarının sağlama toplamlarını kontrol et (tüm görüntüyü diskten okur)
+def verify_snapshot(path):
+    path, manifest = _read_manifest(path)
+    for info in manifest['arrays'].values():
+        if _sha256(os.path.join(path, info['file'])) != info['sha256']:
+            raise ValueError(f"Sağlama toplamı uyuşmuyor: {info['file']}")
+
+# Anlık görüntüyü belleğe eşleyerek (mmap) aç; diziler sorguya hemen hazırdır.
+# Yalnızca sürüm, dtype ve boyut kontrol edilir; tam doğrulama için verify=True.
+def load_snapshot(path, verify=False):
+    if verify:
+        verify_snapshot(path)
+    path, manifest = _read_manifest(path)
+
+    arrays = {}
+    for name, info in manifest['arrays'].items():
+        array = np.load(os.path.join(path, info['file']), mmap_mode='r')
+        if str(array.dtype) != info['dtype'] or list(array.shape) != info['shape']:
+            raise ValueError(f"Dizi biçimi manifest ile uyuşmuyor: {info['file']}")
+        arrays[name] = array
+
+    nodes = manifest['nodes']
+    return {
+        'nodes': nodes,
+        'node_index': {node: i for i, node in enumerate(nodes)},
+        **arrays,
+    }
+
+def neighbors(snapshot, node):
+    i = snapshot['node_index'][node]
+    start, end = snapshot['indptr'][i], snapshot['indptr'][i + 1]
+    nodes = snapshot['nodes']
+    return {nodes[j]: float(w) for j, w in zip(snapshot['indices'][start:end], snapshot['weights'][start:end])}
+
+def mst_edges(snapshot):
+    nodes = snapshot['nodes']
+    return [(nodes[u], nodes[v], float(w))
+            for u, v, w in zip(snapshot['mst_u'], snapshot['mst_v'], snapshot['mst_w'])]
+
+# Kaydedilmiş en kısa yol ağacından yol ve mesafe
+def shortest_path(snapshot, source, target):
+    node_index, nodes = snapshot['node_index'], snapshot['nodes']
+    rows = np.nonzero(snapshot['sources'] == node_index[source])[0]
+    if len(rows) == 0:
+        raise KeyError(f"{source} için en kısa yol ağacı kaydedilmemiş")
+    row = rows[0]
+
+    t = node_index[target]
+    distance = float(snapshot['distances'][row][t])
+    if distance == float('inf'):
+        return None, distance
+    path = []
+    current = t
+    while current != -1:
+        path.append(nodes[current])
+        current = snapshot['predecessors'][row][current]
+    path.reverse()
+    return path, distance
+
+def main():
+    try:
+        num_nodes = int(input("Düğüm sayısını girin (örneğin, 10): "))
+        if num_nodes <= 1:
+            print("Düğüm sayısı 1'den büyük olmalıdır!")
+            return
+    except ValueError:
+        print("Geçerli bir sayı girin!")
+        return
+
+    path = input("Anlık görüntü klasörü (varsayılan: graph_snapshot): ").strip() or 'graph_snapshot'
+
+    graph = create_random_graph(num_nodes)
+    sources = list(graph.keys())[:2]
+    nodes, arrays = build_artifacts(graph, sources)
+    save_snapshot(path, nodes, arrays)
+    print(f"\nAnlık görüntü kaydedildi: {path}")
+
+    # Başka bir işlem gibi: yeniden kurmadan yükle ve sorgula
+    snapshot = load_snapshot(path)
+    print("\nMinimum Spanning Tree (MST):")
+    for u, v, weight in mst_edges(snapshot):
+        print(f"{u}-{v}: {weight:g}")
+    print(f"Toplam ağırlık: {float(snapshot['mst_w'].sum()):g}")
+
+    for source in sources:
+        print(f"\nKaynak ({source}) düğümünden en kısa yollar:")
+        for target in nodes:
+            route, distance = shortest_path(snapshot, source, target)
+            if route is None:
+                print(f"Düğüm {target}'e yol yok.")
+            else:
+                print(f"Düğüm {target}'e yol: {' -> '.join(route)} (Mesafe: {distance:g})")
+
+if __name__ == "__main__":
+    main()
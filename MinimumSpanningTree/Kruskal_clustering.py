@@ -0,0 +1,174 @@
+import heapq
+import numpy as np
+import networkx as nx
+import matplotlib.pyplot as plt
+
+from Kruskal_algorithm_for_random_nodes import create_random_graph, find, union
+
+def _edges(graph, node_index):
+    edges = []
+    for u in graph:
+        for v, weight in graph[u].items():
+            if u < v:  # Tekrar eklemeyi önlemek için
+                edges.append((weight, node_index[u], node_index[v]))
+    return edges
+
+# Kök numaralarını düğüm sırasına göre 0, 1, 2, ... etiketlerine çevir
+def _labels(parent):
+    first = {}
+    return np.array([first.setdefault(find(parent, i), len(first)) for i in range(len(parent))], dtype=np.int64)
+
+# Tek bağlantılı (single-linkage) kümeleme: Kruskal, k bileşen kalınca ya da
+# sıradaki kenar eşiği aşınca durur. Dönüş: etiket dizisi ve birleştirme geçmişi.
+def kruskal_clustering(graph, k=1, threshold=None):
+    nodes = list(graph.keys())
+    node_index = {node: i for i, node in enumerate(nodes)}
+    edges = _edges(graph, node_index)
+    heapq.heapify(edges)
+
+    parent = list(range(len(nodes)))
+    rank = [0] * len(nodes)
+    components = len(nodes)
+    merges = []
+
+    while edges and components > k:
+        weight, u, v = heapq.heappop(edges)
+        if threshold is not None and weight > threshold:
+            break
+        if find(parent, u) != find(parent, v):
+            union(parent, rank, u, v)
+            components -= 1
+            merges.append((nodes[u], nodes[v], weight))
+
+    return nodes, _labels(parent), merges
+
+# Tam birleştirme geçmişi (dendrogram), scipy linkage biçiminde:
+# her satır [küme_a, küme_b, mesafe, yeni_boyut]; yeni küme numarası n + satır.
+# Bağlantısız grafta kalan bileşenler sonda mesafe inf ile birleştirilir (her zaman n-1 satır).
+def merge_history(graph):
+    nodes = list(graph.keys())
+    n = len(nodes)
+    node_index = {node: i for i, node in enumerate(nodes)}
+    edges = sorted(_edges(graph, node_index))
+
+    parent = list(range(n))
+    rank = [0] * n
+    cluster = list(range(n))  # Union-Find kökü -> dendrogram küme numarası
+    size = [1] * n
+    history = []
+
+    for weight, u, v in edges:
+        ru, rv = find(parent, u), find(parent, v)
+        if ru == rv:
+            continue
+        union(parent, rank, u, v)
+        root = find(parent, u)
+        history.append((cluster[ru], cluster[rv], weight, size[ru] + size[rv]))
+        cluster[root] = n + len(history) - 1
+        size[root] = size[ru] + size[rv]
+        if len(history) == n - 1:
+            break
+
+    # Bileşenler arası birleştirmeler (kenar yok: mesafe inf)
+    roots = [i for i in range(n) if find(parent, i) == i]
+    ru = roots[0] if roots else None
+    for rv in roots[1:]:
+        union(parent, rank, ru, rv)
+        root = find(parent, ru)
+        history.append((cluster[ru], cluster[rv], np.inf, size[ru] + size[rv]))
+        cluster[root] = n + len(history) - 1
+        size[root] = size[ru] + size[rv]
+        ru = root
+
+    return nodes, np.array(history, dtype=np.float64).reshape(-1, 4)
+
+# Geçmişi k azalan sırada kaldığı yerden oynatarak her k için etiket üret.
+# inf mesafeli (bileşenler arası) birleştirmeler uygulanmaz; kruskal_clustering gibi
+# bağlantısız grafta k, bileşen sayısından küçük olamaz.
+def _replay(n, history, ks):
+    finite = int(np.isfinite(history[:, 2]).sum())
+    parent = list(range(n))
+    rank = [0] * n
+    leaf = list(range(n))  # Dendrogram küme numarası -> içindeki bir düğüm
+    results = {}
+    done = 0
+    for k in sorted(set(ks), reverse=True):
+        target = min(max(n - k, 0), finite)
+        while done < target:
+            a, b = int(history[done][0]), int(history[done][1])
+            union(parent, rank, leaf[a], leaf[b])
+            leaf.append(leaf[a])
+            done += 1
+        results[k] = _labels(parent)
+    return results
+
+# Tek sıralı geçişten birçok k değeri için etiketler (MST yeniden çalıştırılmaz)
+def sweep_k(graph, ks):
+    nodes, history = merge_history(graph)
+    return nodes, _replay(len(nodes), history, ks)
+
+# Eşik taraması: mesafesi eşikten büyük olmayan birleştirmeler uygulanır
+def sweep_threshold(graph, thresholds):
+    nodes, history = merge_history(graph)
+    k_for = {t: len(nodes) - min(int(np.searchsorted(history[:, 2], t, side='right')),
+                                   int(np.isfinite(history[:, 2]).sum())) for t in thresholds}
+    by_k = _replay(len(nodes), history, k_for.values())
+    return nodes, {t: by_k[k] for t, k in k_for.items()}
+
+def visualize_clusters(graph, nodes, labels, k):
+    G = nx.Graph()
+    for u in graph:
+        for v, weight in graph[u].items():
+            G.add_edge(u, v, weight=weight)
+
+    plt.figure(figsize=(10, 8))
+    pos = nx.spring_layout(G, seed=42)
+
+    color = dict(zip(nodes, labels.tolist()))
+    intra = [(u, v) for u, v in G.edges() if color[u] == color[v]]
+    inter = [(u, v) for u, v in G.edges() if color[u] != color[v]]
+
+    nx.draw_networkx_nodes(G, pos, nodelist=nodes, node_color=labels.tolist(), cmap=plt.cm.tab10, node_size=1000)
+    nx.draw_networkx_edges(G, pos, edgelist=intra, edge_color='green', width=2)
+    nx.draw_networkx_edges(G, pos, edgelist=inter, edge_color='lightgray', width=1, style='dashed')
+
+    edge_labels = {(u, v): d['weight'] for u, v, d in G.edges(data=True)}
+    nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, font_size=10, font_weight='bold')
+    nx.draw_networkx_labels(G, pos, font_size=12, font_weight='bold')
+
+    plt.title(f"Kruskal Kümeleme - {k} küme", fontsize=14, pad=20)
+    plt.axis('off')
+    plt.show()
+
+def main():
+    try:
+        num_nodes = int(input("Düğüm sayısını girin (örneğin, 10): "))
+        k = int(input("Küme sayısını girin (örneğin, 3): "))
+        if num_nodes <= 1 or not 0 < k <= num_nodes:
+            print("Düğüm sayısı 1'den büyük, küme sayısı 1 ile düğüm sayısı arasında olmalıdır!")
+            return
+    except ValueError:
+        print("Geçerli bir sayı girin!")
+        return
+
+    graph = create_random_graph(num_nodes)
+    nodes, labels, merges = kruskal_clustering(graph, k=k)
+
+    print("\nBirleştirmeler:")
+    for step, (u, v, weight) in enumerate(merges, 1):
+        print(f"Adım {step}: {u}-{v} (ağırlık: {weight})")
+
+    print(f"\n{k} küme:")
+    for c in range(labels.max() + 1):
+        members = [node for node, label in zip(nodes, labels) if label == c]
+        print(f"Küme {c}: {', '.join(members)}")
+
+    print("\nTüm k değerleri (tek sıralı geçiş):")
+    _, by_k = sweep_k(graph, range(1, num_nodes + 1))
+    for kk, kk_labels in sorted(by_k.items()):
+        print(f"k={kk}: {kk_labels.tolist()}")
+
+    visualize_clusters(graph, nodes, labels, k)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+import os
+import random
+import numpy as np
+import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+
+from Kruskal_algorithm_for_random_nodes import create_random_graph, kruskal_mst
+
+# Paketlenmiş graf grubu:
+# node_offsets[g]..node_offsets[g+1] : g. grafın düğümleri (global numaralar)
+# edge_offsets[g]..edge_offsets[g+1] : g. grafın kenarları
+# edge_u, edge_v, edge_w             : kenar uçları (global numara) ve ağırlıkları
+# labels (isteğe bağlı)              : global düğüm numarası -> özgün düğüm etiketi
+
+# Sözlük biçimli grafları tek bir paket dizi kümesine çevir
+def pack_graphs(graphs):
+    node_offsets = [0]
+    edge_offsets = [0]
+    edge_u, edge_v, edge_w = [], [], []
+    labels = []
+    for graph in graphs:
+        base = node_offsets[-1]
+        labels.extend(graph)
+        local = {node: base + i for i, node in enumerate(graph)}
+        for u in graph:
+            for v, weight in graph[u].items():
+                if local[u] < local[v]:  # Tekrar eklemeyi önlemek için (etiketler karşılaştırılamayabilir)
+                    edge_u.append(local[u])
+                    edge_v.append(local[v])
+                    edge_w.append(weight)
+        node_offsets.append(base + len(graph))
+        edge_offsets.append(len(edge_u))
+    return {
+        'node_offsets': np.array(node_offsets, dtype=np.int64),
+        'edge_offsets': np.array(edge_offsets, dtype=np.int64),
+        'edge_u': np.array(edge_u, dtype=np.int64),
+        'edge_v': np.array(edge_v, dtype=np.int64),
+        # Girdi ağırlık türü korunur (grup içinde int ve float karışıksa ortak tür float64 olur)
+        'edge_w': np.array(edge_w) if edge_w else np.zeros(0),
+        'labels': labels,
+    }
+
+# create_random_graph ile aynı dağılımı sözlük kurmadan, doğrudan paket dizilerde üret
+def create_random_graph_batch(num_graphs, num_nodes, rng=None):
+    rng = np.random.default_rng() if rng is None else rng
+    node_offsets = np.arange(num_graphs + 1, dtype=np.int64) * num_nodes
+    base = node_offsets[:-1, None]
+
+    # Bağlantılılık için rastgele spanning tree: i. düğüm önceki düğümlerden birine bağlanır
+    perm = np.argsort(rng.random((num_graphs, num_nodes)), axis=1)
+    i = np.arange(1, num_nodes)
+    j = (rng.random((num_graphs, num_nodes - 1)) * i).astype(np.int64)
+    tree_u = perm[:, 1:]
+    tree_v = np.take_along_axis(perm, j, axis=1)
+    tree_w = rng.integers(1, 11, size=tree_u.shape)
+
+    # Ekstra kenarlar: random.sample gibi farklı iki düğüm (u != v)
+    extra_u = rng.integers(0, num_nodes, size=(num_graphs, num_nodes * 2))
+    extra_v = (extra_u + rng.integers(1, num_nodes, size=extra_u.shape)) % num_nodes
+    extra_w = rng.integers(1, 11, size=extra_u.shape)
+
+    # Orijinalde çift zaten grafta ise atlanır, değilse %50 olasılıkla eklenir. Yazı-tura
+    # bağımsız olduğundan eşdeğeri: yazı-turayı geçen adaylardan, ağaçta olmayan her
+    # (sırasız) çiftin ilk geçişi tutulur
+    def pair_key(u, v):
+        return (np.arange(num_graphs)[:, None] * num_nodes + np.minimum(u, v)) * num_nodes + np.maximum(u, v)
+
+    extra_key = pair_key(extra_u, extra_v).ravel()
+    candidate = (rng.random(extra_u.shape) < 0.5).ravel()
+    candidate &= ~np.isin(extra_key, pair_key(tree_u, tree_v))
+    positions = np.nonzero(candidate)[0]
+    _, first = np.unique(extra_key[positions], return_index=True)
+    keep = np.zeros(extra_key.shape, dtype=bool)
+    keep[positions[first]] = True
+    keep = keep.reshape(extra_u.shape)
+
+    edge_u = np.concatenate([tree_u, extra_u], axis=1) + base
+    edge_v = np.concatenate([tree_v, extra_v], axis=1) + base
+    edge_w = np.concatenate([tree_w, extra_w], axis=1)
+    keep = np.concatenate([np.ones(tree_u.shape, dtype=bool), keep], axis=1)
+
+    counts = keep.sum(axis=1)
+    edge_offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+    return {
+        'node_offsets': node_offsets,
+        'edge_offsets': edge_offsets,
+        'edge_u': edge_u[keep],
+        'edge_v': edge_v[keep],
+        'edge_w': edge_w[keep],
+    }
+
+# Tüm grafların MST'lerini tek vektörel geçişte çöz (Borůvka turları)
+# Union-Find kenar kenar ilerlediği için vektörleşmez; Borůvka ise her turda
+# her bileşenin en hafif çıkış kenarını tüm graflar için aynı anda seçer.
+def solve_batch(batch):
+    node_offsets = batch['node_offsets']
+    edge_offsets = batch['edge_offsets']
+    edge_u, edge_v, edge_w = batch['edge_u'], batch['edge_v'], batch['edge_w']
+    num_nodes = int(node_offsets[-1])
+    num_edges = len(edge_w)
+
+    # Eşit ağırlıkları kenar sırası ile ayır (döngü oluşmasını engeller)
+    order = np.argsort(edge_w, kind='stable')
+    rank = np.empty(num_edges, dtype=np.int64)
+    rank[order] = np.arange(num_edges)
+
+    component = np.arange(num_nodes, dtype=np.int64)
+    in_mst = np.zeros(num_edges, dtype=bool)
+    alive = np.arange(num_edges, dtype=np.int64)
+
+    while True:
+        cu, cv = component[edge_u[alive]], component[edge_v[alive]]
+        crossing = cu != cv
+        alive, cu, cv = alive[crossing], cu[crossing], cv[crossing]
+        if len(alive) == 0:
+            break
+
+        # Her bileşenin en hafif çıkış kenarı
+        best = np.full(num_nodes, num_edges, dtype=np.int64)
+        np.minimum.at(best, cu, rank[alive])
+        np.minimum.at(best, cv, rank[alive])
+        has_edge = best < num_edges
+        chosen = order[best[has_edge]]
+        in_mst[chosen] = True
+
+        # Bileşeni seçtiği kenarın öbür ucuna bağla
+        roots = np.nonzero(has_edge)[0]
+        a, b = component[edge_u[chosen]], component[edge_v[chosen]]
+        target = np.where(a == roots, b, a)
+        parent = np.arange(num_nodes, dtype=np.int64)
+        parent[roots] = target
+
+        # İki bileşen aynı kenarı seçtiyse küçük numaralı kök olsun
+        mutual = (parent[parent] == np.arange(num_nodes)) & (np.arange(num_nodes) < parent)
+        parent[mutual] = np.nonzero(mutual)[0]
+
+        # Pointer jumping ile kökleri sıkıştır
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+        component = parent[component]
+
+    graph_of_edge = np.repeat(np.arange(len(edge_offsets) - 1), np.diff(edge_offsets))
+    # Toplam ağırlıklar girdi türünden bağımsız olarak float64 döner
+    total_weight = np.bincount(graph_of_edge[in_mst], weights=edge_w[in_mst],
+                               minlength=len(edge_offsets) - 1)
+    return total_weight, in_mst
+
+# Grafların [start, stop) aralığını ayrı bir paket olarak kes
+def slice_batch(batch, start, stop):
+    node_offsets, edge_offsets = batch['node_offsets'], batch['edge_offsets']
+    n0, e0, e1 = node_offsets[start], edge_offsets[start], edge_offsets[stop]
+    return {
+        'node_offsets': node_offsets[start:stop + 1] - n0,
+        'edge_offsets': edge_offsets[start:stop + 1] - e0,
+        'edge_u': batch['edge_u'][e0:e1] - n0,
+        'edge_v': batch['edge_v'][e0:e1] - n0,
+        'edge_w': batch['edge_w'][e0:e1],
+    }
+
+# İsteğe bağlı: grupları işlem havuzuna dağıt
+def solve_batch_parallel(batch, workers=None, chunks=None):
+    num_graphs = len(batch['node_offsets']) - 1
+    if workers == 1 or num_graphs == 0:
+        return solve_batch(batch)
+
+    workers = workers or os.cpu_count()
+    chunks = min(chunks or workers * 4, num_graphs)
+    bounds = np.linspace(0, num_graphs, chunks + 1).astype(np.int64)
+    parts = [slice_batch(batch, s, e) for s, e in zip(bounds[:-1], bounds[1:])]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(solve_batch, parts))
+
+    total_weight = np.concatenate([w for w, _ in results])
+    in_mst = np.concatenate([m for _, m in results])
+    return total_weight, in_mst
+
+# g. grafın MST kenarlarını (u, v, ağırlık) listesi olarak al. Düğümler pack_graphs'ın
+# sakladığı özgün etiketlerle, etiket yoksa (create_random_graph_batch) A, B, C, ... ile adlandırılır.
+def mst_edges(batch, in_mst, g):
+    n0 = batch['node_offsets'][g]
+    e0, e1 = batch['edge_offsets'][g], batch['edge_offsets'][g + 1]
+    mask = in_mst[e0:e1]
+    us = batch['edge_u'][e0:e1][mask]
+    vs = batch['edge_v'][e0:e1][mask]
+    ws = batch['edge_w'][e0:e1][mask]
+    if 'labels' in batch:
+        name = batch['labels'].__getitem__
+    else:
+        name = lambda i: chr(65 + int(i - n0))
+    return [(name(u), name(v), w.item()) for u, v, w in zip(us, vs, ws)]
+
+def main():
+    try:
+        num_graphs = int(input("Graf sayısını girin (örneğin, 100000): "))
+        num_nodes = int(input("Graf başına düğüm sayısını girin (örneğin, 10): "))
+        if num_graphs <= 0 or num_nodes <= 1:
+            print("Graf sayısı pozitif, düğüm sayısı 1'den büyük olmalıdır!")
+            return
+    except ValueError:
+        print("Geçerli bir sayı girin!")
+        return
+
+    batch = create_random_graph_batch(num_graphs, num_nodes)
+    total_weight, in_mst = solve_batch_parallel(batch)
+
+    print("\nİlk grafın MST'si:")
+    for u, v, weight in mst_edges(batch, in_mst, 0):
+        print(f"{u}-{v}: {weight}")
+    print(f"Toplam ağırlık: {total_weight[0]:g}")
+
+    # Kruskal ile örnek karşılaştırma
+    sample = random.sample(range(num_graphs), min(num_graphs, 100))
+    for g in sample:
+        n0 = batch['node_offsets'][g]
+        e0, e1 = batch['edge_offsets'][g], batch['edge_offsets'][g + 1]
+        graph = {chr(65 + i): {} for i in range(num_nodes)}
+        for u, v, w in zip(batch['edge_u'][e0:e1] - n0, batch['edge_v'][e0:e1] - n0, batch['edge_w'][e0:e1]):
+            a, b = chr(65 + int(u)), chr(65 + int(v))
+            graph[a][b] = w
+            graph[b][a] = w
+        assert sum(w for _, _, w in kruskal_mst(graph)) == total_weight[g]
+    print(f"{len(sample)} örnek graf Kruskal ile doğrulandı.")
+
+    # Üreteç create_random_graph ile aynı dağılımı vermeli: ortalama kenar sayısı ve MST ağırlığı
+    reference = [create_random_graph(num_nodes) for _ in range(min(num_graphs, 2000))]
+    ref_edges = np.mean([sum(len(adj) for adj in graph.values()) / 2 for graph in reference])
+    ref_weight = np.mean([sum(w for _, _, w in kruskal_mst(graph)) for graph in reference])
+    print(f"Ortalama kenar sayısı: paket {np.diff(batch['edge_offsets']).mean():.3f}, "
+          f"create_random_graph {ref_edges:.3f}")
+    print(f"Ortalama MST ağırlığı: paket {total_weight.mean():.3f}, create_random_graph {ref_weight:.3f}")
+
+    print(f"\nMST ağırlığı: ortalama {total_weight.mean():.3f}, std {total_weight.std():.3f}")
+    plt.figure(figsize=(10, 6))
+    plt.hist(total_weight, bins=50, color='lightblue', edgecolor='black')
+    plt.title(f"{num_graphs} rastgele graf için MST ağırlığı dağılımı ({num_nodes} düğüm)", fontsize=14)
+    plt.xlabel("Toplam ağırlık")
+    plt.ylabel("Graf sayısı")
+    plt.show()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+import random
+import numpy as np
+import networkx as nx
+import matplotlib.pyplot as plt
+from collections import deque
+
+from Kruskal_algorithm_for_random_nodes import create_random_graph, kruskal_mst, find, union
+
+# MST üzerinde yol-maksimum sorgu indeksi (binary lifting)
+# up[k][x]   : x düğümünün 2^k üstteki atası
+# max_w[k][x]: x'ten bu ataya kadar olan yoldaki en ağır kenar
+def build_path_max_index(mst, nodes=None):
+    if nodes is None:
+        nodes = sorted({u for u, _, _ in mst} | {v for _, v, _ in mst})
+    nodes = list(nodes)
+    node_index = {node: i for i, node in enumerate(nodes)}
+    n = len(nodes)
+
+    adjacency = [[] for _ in range(n)]
+    for u, v, weight in mst:
+        iu, iv = node_index[u], node_index[v]
+        adjacency[iu].append((iv, weight))
+        adjacency[iv].append((iu, weight))
+
+    # Ağacı (veya ormanı) BFS ile köklendir
+    parent = np.arange(n, dtype=np.int64)
+    parent_weight = np.full(n, -np.inf)
+    depth = np.zeros(n, dtype=np.int64)
+    component = np.full(n, -1, dtype=np.int64)
+    for root in range(n):
+        if component[root] != -1:
+            continue
+        component[root] = root
+        queue = deque([root])
+        while queue:
+            x = queue.popleft()
+            for y, weight in adjacency[x]:
+                if component[y] == -1:
+                    component[y] = root
+                    parent[y] = x
+                    parent_weight[y] = weight
+                    depth[y] = depth[x] + 1
+                    queue.append(y)
+
+    # Atlama tablolarını katman katman doldur
+    log = max(1, int(depth.max()).bit_length()) if n else 1
+    up = np.empty((log, n), dtype=np.int64)
+    max_w = np.empty((log, n))
+    up[0] = parent
+    max_w[0] = parent_weight
+    for k in range(1, log):
+        up[k] = up[k - 1][up[k - 1]]
+        max_w[k] = np.maximum(max_w[k - 1], max_w[k - 1][up[k - 1]])
+
+    return {
+        'nodes': nodes,
+        'node_index': node_index,
+        'depth': depth,
+        'component': component,
+        'up': up,
+        'max_w': max_w,
+    }
+
+# Tek sorgu: (LCA, u-v yolundaki en ağır kenar), O(log V)
+def _query(index, iu, iv):
+    depth, up, max_w = index['depth'], index['up'], index['max_w']
+    if index['component'][iu] != index['component'][iv]:
+        return -1, float('inf')  # Farklı ağaçlar: yol yok
+
+    best = float('-inf')
+    if depth[iu] < depth[iv]:
+        iu, iv = iv, iu
+    diff = int(depth[iu] - depth[iv])
+    k = 0
+    while diff:
+        if diff & 1:
+            best = max(best, max_w[k][iu])
+            iu = up[k][iu]
+        diff >>= 1
+        k += 1
+    if iu == iv:
+        return int(iu), float(best)
+
+    for k in range(len(up) - 1, -1, -1):
+        if up[k][iu] != up[k][iv]:
+            best = max(best, max_w[k][iu], max_w[k][iv])
+            iu, iv = up[k][iu], up[k][iv]
+    best = max(best, max_w[0][iu], max_w[0][iv])
+    return int(up[0][iu]), float(best)
+
+def lca(index, u, v):
+    node_index = index['node_index']
+    ancestor, _ = _query(index, node_index[u], node_index[v])
+    return index['nodes'][ancestor] if ancestor != -1 else None
+
+def path_max(index, u, v):
+    node_index = index['node_index']
+    return _query(index, node_index[u], node_index[v])[1]
+
+# Etiketli (u, v, ağırlık) listesini indeks dizilerine çevir
+def to_index_arrays(index, edges):
+    node_index = index['node_index']
+    us = np.fromiter((node_index[u] for u, _, _ in edges), dtype=np.int64, count=len(edges))
+    vs = np.fromiter((node_index[v] for _, v, _ in edges), dtype=np.int64, count=len(edges))
+    ws = np.fromiter((w for _, _, w in edges), dtype=np.float64, count=len(edges))
+    return us, vs, ws
+
+# Toplu sorgu: tüm aday kenarlar için LCA ve yol-maksimum tek vektörel geçişte
+def bulk_path_max(index, us, vs):
+    depth, up, max_w = index['depth'], index['up'], index['max_w']
+    us = np.asarray(us, dtype=np.int64)
+    vs = np.asarray(vs, dtype=np.int64)
+    same_tree = index['component'][us] == index['component'][vs]
+
+    # Derin olan düğüm u olsun
+    swap = depth[us] < depth[vs]
+    us, vs = np.where(swap, vs, us), np.where(swap, us, vs)
+    best = np.full(len(us), -np.inf)
+
+    # u'yu v ile aynı derinliğe çıkar
+    diff = depth[us] - depth[vs]
+    for k in range(len(up)):
+        mask = ((diff >> k) & 1).astype(bool)
+        best = np.where(mask, np.maximum(best, max_w[k][us]), best)
+        us = np.where(mask, up[k][us], us)
+
+    # Ortak atanın hemen altına kadar birlikte zıpla
+    for k in range(len(up) - 1, -1, -1):
+        mask = up[k][us] != up[k][vs]
+        best = np.where(mask, np.maximum(best, np.maximum(max_w[k][us], max_w[k][vs])), best)
+        us = np.where(mask, up[k][us], us)
+        vs = np.where(mask, up[k][vs], vs)
+
+    apart = us != vs
+    best = np.where(apart, np.maximum(best, np.maximum(max_w[0][us], max_w[0][vs])), best)
+    ancestors = np.where(apart, up[0][us], us)
+
+    best = np.where(same_tree, best, np.inf)
+    ancestors = np.where(same_tree, ancestors, -1)
+    return ancestors, best
+
+# Aday kenar ağacı iyileştirir mi? (ağırlık < yoldaki en ağır kenar)
+def classify_candidate_edges(index, us, vs, ws):
+    _, best = bulk_path_max(index, us, vs)
+    return np.asarray(ws, dtype=np.float64) < best
+
+# Grafın bağlantılı bileşen sayısı (Union-Find)
+def _count_components(graph):
+    parent = {node: node for node in graph}
+    rank = {node: 0 for node in graph}
+    components = len(graph)
+    for u in graph:
+        for v in graph[u]:
+            if find(parent, u) != find(parent, v):
+                union(parent, rank, u, v)
+                components -= 1
+    return components
+
+# MST doğrulama: önce mst'nin graph'ın bir kapsayan ormanı olduğu kontrol edilir
+# (her kenar grafta aynı ağırlıkla var, döngü yok, kenar sayısı n - bileşen sayısı),
+# sonra hiçbir ağaç dışı kenarın ağacı iyileştirmediği kontrol edilir
+def verify_mst(graph, mst):
+    parent = {node: node for node in graph}
+    rank = {node: 0 for node in graph}
+    for u, v, weight in mst:
+        if u not in graph or graph[u].get(v) != weight:
+            return False
+        if find(parent, u) == find(parent, v):
+            return False  # Döngü
+        union(parent, rank, u, v)
+    if len(mst) != len(graph) - _count_components(graph):
+        return False
+
+    index = build_path_max_index(mst, nodes=list(graph.keys()))
+    edges = [(u, v, w) for u in graph for v, w in graph[u].items() if u < v]
+    if not edges:
+        return True
+    us, vs, ws = to_index_arrays(index, edges)
+    return not classify_candidate_edges(index, us, vs, ws).any()
+
+# Duyarlılık analizi: ağaç dışı kenar MST'ye girmek için ne kadar hafiflemeli.
+# Ormanda iki farklı ağacı bağlayan kenar için değer None'dır
+# (böyle bir kenar ağırlığından bağımsız olarak ormanı her zaman iyileştirir).
+def edge_sensitivity(graph, mst):
+    index = build_path_max_index(mst, nodes=list(graph.keys()))
+    tree_edges = {frozenset((u, v)) for u, v, _ in mst}
+    edges = [(u, v, w) for u in graph for v, w in graph[u].items()
+             if u < v and frozenset((u, v)) not in tree_edges]
+    if not edges:
+        return []
+    us, vs, ws = to_index_arrays(index, edges)
+    _, best = bulk_path_max(index, us, vs)
+    return [(u, v, w, float(w - b) if b != np.inf else None) for (u, v, w), b in zip(edges, best)]
+
+def visualize_query(graph, mst, u, v, weight, improves):
+    G = nx.Graph()
+    for a in graph:
+        for b, w in graph[a].items():
+            G.add_edge(a, b, weight=w)
+
+    T = nx.Graph()
+    T.add_weighted_edges_from(mst)
+    path = nx.shortest_path(T, u, v) if nx.has_path(T, u, v) else [u]
+    path_edges = list(zip(path, path[1:]))
+
+    plt.figure(figsize=(10, 8))
+    pos = nx.spring_layout(G, seed=42)
+
+    mst_edges = [(a, b) for a, b, _ in mst]
+    nx.draw_networkx_nodes(G, pos, node_color='lightblue', node_size=1000)
+    nx.draw_networkx_edges(G, pos, edgelist=list(G.edges()), edge_color='lightgray', width=1)
+    nx.draw_networkx_edges(G, pos, edgelist=mst_edges, edge_color='green', width=2)
+    nx.draw_networkx_edges(G, pos, edgelist=path_edges, edge_color='orange', width=3)
+    nx.draw_networkx_edges(G, pos, edgelist=[(u, v)], edge_color='red', width=3, style='dashed')
+
+    edge_labels = {(a, b): d['weight'] for a, b, d in G.edges(data=True)}
+    nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, font_size=10, font_weight='bold')
+    nx.draw_networkx_labels(G, pos, font_size=12, font_weight='bold')
+
+    result = "iyileştirir" if improves else "iyileştirmez"
+    plt.title(f"Aday kenar {u}-{v} (ağırlık: {weight}) ağacı {result}", fontsize=14, pad=20)
+    plt.axis('off')
+    plt.show()
+
+def main():
+    try:
+        num_nodes = int(input("Düğüm sayısını girin (örneğin, 10): "))
+        if num_nodes <= 1:
+            print("Düğüm sayısı 1'den büyük olmalıdır!")
+            return
+    except ValueError:
+        print("Geçerli bir sayı girin!")
+        return
+
+    graph = create_random_graph(num_nodes)
+    mst = list(kruskal_mst(graph))
+    index = build_path_max_index(mst, nodes=list(graph.keys()))
+
+    print("\nMinimum Spanning Tree (MST):")
+    for u, v, weight in mst:
+        print(f"{u}-{v}: {weight}")
+    print(f"MST doğrulandı: {verify_mst(graph, mst)}")
+
+    # Rastgele aday kenarları tek tek sorgula
+    nodes = list(graph.keys())
+    print("\nAday kenar sorguları:")
+    for _ in range(5):
+        u, v = random.sample(nodes, 2)
+        weight = random.randint(1, 10)
+        heaviest = path_max(index, u, v)
+        print(f"{u}-{v} (ağırlık: {weight}): LCA={lca(index, u, v)}, "
+              f"yoldaki en ağır kenar={heaviest:g}, iyileştirir={weight < heaviest}")
+
+    # Toplu sınıflandırma
+    count = 1_000_000
+    us = np.random.randint(0, num_nodes, size=count)
+    vs = np.random.randint(0, num_nodes, size=count)
+    ws = np.random.randint(1, 11, size=count)
+    improves = classify_candidate_edges(index, us, vs, ws)
+    print(f"\n{count} aday kenardan {int(improves.sum())} tanesi ağacı iyileştirir")
+
+    print("\nDuyarlılık (ağaç dışı kenar: MST'ye girmek için gereken azalma):")
+    for u, v, weight, slack in edge_sensitivity(graph, mst):
+        print(f"{u}-{v} (ağırlık: {weight}): {'farklı ağaçları bağlar' if slack is None else f'{slack:g}'}")
+
+    u, v = random.sample(nodes, 2)
+    weight = random.randint(1, 10)
+    visualize_query(graph, mst, u, v, weight, weight < path_max(index, u, v))
+
+if __name__ == "__main__":
+    main()
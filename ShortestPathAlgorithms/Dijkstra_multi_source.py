@@ -0,0 +1,192 @@
+import os
+import random
+import shutil
+import tempfile
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+def create_random_graph(num_nodes, num_edges):
+    # Yönlü, pozitif ağırlıklı graf: (u, v, ağırlık)
+    graph = []
+    for _ in range(num_edges):
+        u, v = random.sample(range(num_nodes), 2)
+        graph.append((u, v, random.randint(1, 10)))
+    return graph
+
+# Kenar listesini CSR dizilerine çevir (indptr, indices, weights).
+# scipy int32 indeks bekler; uygun boyutta int32 kullanılır ki csr_matrix kopyalamasın.
+def to_csr(graph, num_nodes):
+    edges = np.array(graph, dtype=np.float64).reshape(-1, 3)
+    if (edges[:, 2] < 0).any():
+        raise ValueError("Dijkstra negatif ağırlıklı kenarlarla çalışmaz!")
+    index_dtype = np.int32 if max(num_nodes, len(edges)) < 2 ** 31 else np.int64
+    src = edges[:, 0].astype(np.int64)
+    order = np.argsort(src, kind='stable')
+    indptr = np.zeros(num_nodes + 1, dtype=index_dtype)
+    np.cumsum(np.bincount(src, minlength=num_nodes), out=indptr[1:])
+    return indptr, edges[order, 1].astype(index_dtype), edges[order, 2]
+
+# CSR dizilerini kopyalamadan saran seyrek matris (paralel kenarlarda en hafifi kullanılır)
+def _adjacency(indptr, indices, weights):
+    num_nodes = len(indptr) - 1
+    return csr_matrix((weights, indices, indptr), shape=(num_nodes, num_nodes), copy=False)
+
+# Verilen kaynak satırlarını çöz ve sonuçları hedef matrislere yaz
+def _solve_rows(adjacency, sources, distances, predecessors):
+    dist, pred = dijkstra(adjacency, indices=sources, return_predecessors=True)
+    distances[...] = dist
+    predecessors[...] = np.where(pred < 0, -1, pred)
+
+# Paylaşılan bellekte numpy dizisi oluştur
+def _shared_array(shape, dtype, fill):
+    size = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+    shm = SharedMemory(create=True, size=size)
+    array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    array[...] = fill
+    return shm, array
+
+# İşçi süreç durumu: graf ve sonuç bloklarına bir kez bağlanılır
+_worker = {}
+
+def _init_worker(specs):
+    for name, spec in specs.items():
+        if spec[0] == 'memmap':  # Çağıranın verdiği dosya tabanlı sonuç dizisi
+            _, filename, shape, dtype, offset = spec
+            _worker[name] = np.memmap(filename, dtype=dtype, mode='r+', offset=offset, shape=shape)
+        else:
+            _, shm_name, shape, dtype = spec
+            shm = SharedMemory(name=shm_name)
+            _worker[name + '_shm'] = shm
+            _worker[name] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    # Graf paylaşılan bloklar üzerinde doğrudan kullanılır, işçiye kopyalanmaz
+    _worker['adjacency'] = _adjacency(_worker['indptr'], _worker['indices'], _worker['weights'])
+
+def _run_chunk(rows):
+    start, end = rows
+    _solve_rows(_worker['adjacency'], _worker['sources'][start:end],
+                _worker['distances'][start:end], _worker['predecessors'][start:end])
+    return rows
+
+def _check_out(out, shape, parallel):
+    for array, dtype in zip(out, (np.float64, np.int64)):
+        if array.shape != shape or array.dtype != dtype:
+            raise ValueError(f"out dizileri {shape} boyutunda float64 ve int64 olmalıdır")
+        if parallel and (not isinstance(array, np.memmap) or array.filename is None):
+            raise ValueError("İşlem havuzu ile out dizileri dosya tabanlı np.memmap olmalıdır")
+
+# Çok kaynaklı toplu Dijkstra: graf paylaşılan belleğe bir kez konur, kaynaklar
+# işlem havuzuna dağıtılır ve işçiler sonuçları doğrudan sonuç matrislerine yazar.
+# out=(distances, predecessors) verilirse (havuzla çalışırken np.memmap) işçiler doğrudan
+# bu dizilere yazar ve aynı diziler döndürülür: kopya yok, ömürleri çağıranda.
+# out verilmezse sonuçlar paylaşılan bellekten bir kez çağırana kopyalanır.
+def multi_source_dijkstra(graph, num_nodes, sources, workers=None, chunk_size=8, out=None):
+    indptr, indices, weights = to_csr(graph, num_nodes)
+    sources = np.asarray(sources, dtype=np.int64)
+    workers = workers or os.cpu_count()
+    shape = (len(sources), num_nodes)
+
+    # Tek işçi ya da tek parça: havuz açmadan aynı süreçte çöz
+    if workers == 1 or len(sources) <= chunk_size:
+        if out is None:
+            out = (np.empty(shape), np.empty(shape, dtype=np.int64))
+        _check_out(out, shape, parallel=False)
+        if len(sources):
+            _solve_rows(_adjacency(indptr, indices, weights), sources, *out)
+        return out
+
+    if out is not None:
+        _check_out(out, shape, parallel=True)
+
+    blocks = {}
+    try:
+        for name, array in (('indptr', indptr), ('indices', indices), ('weights', weights), ('sources', sources)):
+            blocks[name] = _shared_array(array.shape, array.dtype, array)
+        if out is None:
+            blocks['distances'] = _shared_array(shape, np.float64, np.inf)
+            blocks['predecessors'] = _shared_array(shape, np.int64, -1)
+        specs = {name: ('shm', shm.name, array.shape, array.dtype.str) for name, (shm, array) in blocks.items()}
+        if out is not None:
+            for name, array in zip(('distances', 'predecessors'), out):
+                specs[name] = ('memmap', array.filename, array.shape, array.dtype.str, array.offset)
+
+        chunks = [(i, min(i + chunk_size, len(sources))) for i in range(0, len(sources), chunk_size)]
+        with Pool(workers, initializer=_init_worker, initargs=(specs,)) as pool:
+            for _ in pool.imap_unordered(_run_chunk, chunks):
+                pass
+
+        if out is not None:
+            return out
+        return blocks['distances'][1].copy(), blocks['predecessors'][1].copy()
+    finally:
+        for shm, _ in blocks.values():
+            shm.close()
+            shm.unlink()
+
+# "En yakın kaynak" modu: tüm kaynaklar 0 mesafeyle kuyruğa girer (sanal süper kaynak),
+# tek geçişte her düğüm için en yakın kaynağa mesafe ve o kaynak bulunur
+def nearest_source_dijkstra(graph, num_nodes, sources):
+    indptr, indices, weights = to_csr(graph, num_nodes)
+    distances, predecessors, origin = dijkstra(_adjacency(indptr, indices, weights),
+                                               indices=list(sources), min_only=True,
+                                               return_predecessors=True)
+    predecessors = np.where(predecessors < 0, -1, predecessors).astype(np.int64)
+    origin = np.where(origin < 0, -1, origin).astype(np.int64)
+    return distances, predecessors, origin
+
+def get_path(predecessors, target):
+    path = []
+    current = target
+    while current != -1:
+        path.append(int(current))
+        current = predecessors[current]
+    path.reverse()
+    return path
+
+def main():
+    try:
+        num_nodes = int(input("Düğüm sayısını girin (örneğin, 1000): "))
+        num_sources = int(input("Kaynak sayısını girin (örneğin, 100): "))
+        if num_nodes <= 1 or not 0 < num_sources <= num_nodes:
+            print("Düğüm sayısı 1'den büyük, kaynak sayısı 1 ile düğüm sayısı arasında olmalıdır!")
+            return
+    except ValueError:
+        print("Geçerli bir sayı girin!")
+        return
+
+    graph = create_random_graph(num_nodes, num_nodes * 4)
+    sources = random.sample(range(num_nodes), num_sources)
+
+    # Sonuçlar dosya tabanlı np.memmap dizilerine doğrudan yazılır (kopya yok)
+    workdir = tempfile.mkdtemp()
+    shape = (num_sources, num_nodes)
+    distances = np.memmap(os.path.join(workdir, 'distances.dat'), dtype=np.float64, mode='w+', shape=shape)
+    predecessors = np.memmap(os.path.join(workdir, 'predecessors.dat'), dtype=np.int64, mode='w+', shape=shape)
+    multi_source_dijkstra(graph, num_nodes, sources, out=(distances, predecessors))
+    print(f"\n{num_sources} kaynaktan mesafeler hesaplandı ({distances.shape[0]} x {distances.shape[1]})")
+
+    source, target = sources[0], random.randrange(num_nodes)
+    if distances[0][target] == float('inf'):
+        print(f"Kaynak ({source}) düğümünden düğüm {target}'e yol yok.")
+    else:
+        path = get_path(predecessors[0], target)
+        print(f"Kaynak ({source}) düğümünden düğüm {target}'e yol: "
+              f"{' -> '.join(map(str, path))} (Mesafe: {distances[0][target]:g})")
+
+    nearest, _, origin = nearest_source_dijkstra(graph, num_nodes, sources)
+    assert np.array_equal(nearest, distances.min(axis=0))
+    print("\nEn yakın kaynak (ilk 10 düğüm):")
+    print("Düğüm | Mesafe | En Yakın Kaynak")
+    print("-" * 35)
+    for i in range(min(10, num_nodes)):
+        dist = f"{nearest[i]:g}" if nearest[i] != float('inf') else "∞"
+        src = str(origin[i]) if origin[i] != -1 else "-"
+        print(f"{i:<5} | {dist:>6} | {src:>15}")
+
+    del distances, predecessors  # memmap'ler kapanmadan dosyalar silinemez (Windows)
+    shutil.rmtree(workdir)
+
+if __name__ == "__main__":
+    main()